@@ -2,21 +2,40 @@ import abc
 import dataclasses
 import functools
 import logging
+import queue
+import sys
+import threading
 from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
-from typing import Any, Callable, Dict, List
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from hamilton import node
 from hamilton.execution.graph_functions import execute_subdag
 from hamilton.execution.grouping import NodeGroupPurpose, TaskImplementation
 from hamilton.execution.state import ExecutionState, GraphState, TaskState
+from hamilton.lifecycle import base as lifecycle_base
 
 logger = logging.getLogger(__name__)
 
+# How long to block waiting for an in-flight task to notify us of its completion. When this
+# times out, we only retry releasing (previously rejected) tasks -- notifying futures are only
+# ever reaped from the completion queue, so this does not catch a completion that never arrives.
+WAKE_TIMEOUT_SECONDS = 1.0
+# How long to wait between polls when some in-flight futures cannot notify us of completion.
+# This doubles every time a poll finds nothing has changed, up to the max, and resets otherwise.
+MIN_POLL_INTERVAL_SECONDS = 0.0001
+MAX_POLL_INTERVAL_SECONDS = 0.01
+
 
 @dataclasses.dataclass
 class TaskFuture:
     """Simple representation of a future. TODO -- add cancel().
-    This a clean wrapper over a python future, and we may end up just using that at some point."""
+    This a clean wrapper over a python future, and we may end up just using that at some point.
+    Note this uses __slots__ so we don't carry a __dict__ around for every task."""
+
+    __slots__ = ("get_state", "get_result")
 
     get_state: Callable[[], TaskState]
     get_result: Callable[[], Any]
@@ -117,7 +136,7 @@ def base_execute_task(task: TaskImplementation) -> Dict[str, Any]:
             nodes=task.nodes,
             inputs=task.dynamic_inputs,
             adapter=task.adapter,
-            overrides={**task.dynamic_inputs, **task.overrides},
+            overrides=task.merged_overrides,
             run_id=task.run_id,
             task_id=task.task_id,
         )
@@ -151,6 +170,22 @@ def base_execute_task(task: TaskImplementation) -> Dict[str, Any]:
     return final_retval
 
 
+class _CompletedTaskFuture(TaskFuture):
+    """TaskFuture for a task that has already completed successfully, E.G. one run at submit time.
+    This saves us creating closures over the result for every task."""
+
+    __slots__ = ("_result",)
+
+    def __init__(self, result: Dict[str, Any]):
+        self._result = result
+
+    def get_state(self) -> TaskState:
+        return TaskState.SUCCESSFUL
+
+    def get_result(self) -> Dict[str, Any]:
+        return self._result
+
+
 class SynchronousLocalTaskExecutor(TaskExecutor):
     """Basic synchronous/local task executor that runs tasks
     in the same process, at submit time."""
@@ -162,8 +197,7 @@ class SynchronousLocalTaskExecutor(TaskExecutor):
         :return: Future associated with this task
         """
         # No error management for now
-        result = base_execute_task(task)
-        return TaskFuture(get_state=lambda: TaskState.SUCCESSFUL, get_result=lambda: result)
+        return _CompletedTaskFuture(base_execute_task(task))
 
     def can_submit_task(self) -> bool:
         """We can always submit a task as the task submission is blocking!
@@ -182,46 +216,92 @@ class SynchronousLocalTaskExecutor(TaskExecutor):
 class TaskFutureWrappingPythonFuture(TaskFuture):
     """Wraps a python future in a TaskFuture"""
 
+    __slots__ = ("future", "_cached_state", "_cached_result", "_cached_exception")
+
     def __init__(self, future: Future):
         self.future = future
+        # We resolve the future once, the first time we see it's done, and cache the outcome
+        self._cached_state = None
+        self._cached_result = None
+        self._cached_exception = None
+
+    def _resolve(self):
+        """Caches the outcome of the future if it is done and we have not yet done so."""
+        if self._cached_state is not None or not self.future.done():
+            return
+        try:
+            self._cached_result = self.future.result()
+        except Exception as e:
+            logger.exception("Task failed")
+            self._cached_exception = e
+            self._cached_state = TaskState.FAILED
+        else:
+            self._cached_state = TaskState.SUCCESSFUL
 
     def get_state(self):
         """Gets the state. This is non-blocking."""
-
-        if self.future.done():
-            try:
-                self.future.result()
-            except Exception:
-                logger.exception("Task failed")
-                return TaskState.FAILED
-            return TaskState.SUCCESSFUL
-        else:
+        self._resolve()
+        if self._cached_state is None:
             return TaskState.RUNNING
+        return self._cached_state
 
     def get_result(self):
-        """Gets the result. This is non-blocking.
+        """Gets the result. This is non-blocking. Raises the task's exception if it failed.
 
         :return: None if there is no result, else the result
         """
-        if not self.future.done():
-            return None
-        out = self.future.result()
-        return out
+        self._resolve()
+        if self._cached_exception is not None:
+            raise self._cached_exception
+        return self._cached_result
+
+    def _release(self):
+        """Drops our references to the future and its result, once whoever consumes the result
+        is done with it. This lets it be garbage collected (or freed remotely, for dask/ray)
+        rather than living as long as this does. The state is kept, so that is still queryable.
+        """
+        self._resolve()
+        self.future = None
+        self._cached_result = None
+        self._cached_exception = None
+
+    def add_done_callback(self, callback: Callable[[], None]):
+        """Registers a callback to be called (with no arguments) once the future completes.
+        Note this may be called from another thread.
+
+        :param callback: Callback to call on completion
+        """
+        self.future.add_done_callback(lambda _: callback())
 
 
 class PoolExecutor(TaskExecutor, abc.ABC):
     """Base class for a pool-based executor (threadpool executor/multiprocessing executor).
-    Handles common logic, stores active future, and manages max tasks.
+    Handles common logic, tracks the number of in-flight tasks, and manages max tasks.
     """
 
-    def __init__(self, max_tasks: int):
-        self.active_futures = []
+    def __init__(
+        self, max_tasks: int, initializer: Optional[Callable] = None, initargs: Tuple = ()
+    ):
+        """Instantiates a pool executor. Note this does not create the pool -- that is done
+        lazily, on the first submission after init().
+
+        :param max_tasks: Maximum number of tasks to run at once
+        :param initializer: Callable run in each worker as it starts, E.G. to set up
+            worker-local caches/connections. This is passed to the underlying pool.
+        :param initargs: Arguments to pass to the initializer
+        """
+        self.initializer = initializer
+        self.initargs = initargs
+        # Decremented by a done-callback, which can run on another thread, hence the lock
+        self._inflight = 0
+        self._inflight_lock = threading.Lock()
         self.initialized = False
         self.pool = None
         self.max_tasks = max_tasks  # TODO -- allow infinite/no max.
 
-    def _prune_active_futures(self):
-        self.active_futures = [f for f in self.active_futures if not f.done()]
+    def _task_done(self, future: Future):
+        with self._inflight_lock:
+            self._inflight -= 1
 
     @abc.abstractmethod
     def create_pool(self) -> Executor:
@@ -232,17 +312,19 @@ class PoolExecutor(TaskExecutor, abc.ABC):
         pass
 
     def init(self):
-        """Creates/initializes pool"""
+        """Initializes the executor. Note the pool itself is created lazily, on the first
+        submission, so we don't pay to start workers if no task ever gets sent to it."""
         if not self.initialized:
-            self.pool = self.create_pool()
             self.initialized = True
         else:
             raise RuntimeError("Cannot initialize an already initialized executor")
 
     def finalize(self):
-        """Finalizes pool, freeing up resources"""
+        """Finalizes pool (if we created one), freeing up resources"""
         if self.initialized:
-            self.pool.shutdown()
+            if self.pool is not None:
+                self.pool.shutdown()
+                self.pool = None
             self.initialized = False
         else:
             raise RuntimeError("Cannot finalize an uninitialized executor")
@@ -253,10 +335,23 @@ class PoolExecutor(TaskExecutor, abc.ABC):
         :param task: Task to submit
         :return: The future associated with the task
         """
+        return self._submit(base_execute_task, task)
+
+    def _submit(self, fn: Callable, *args) -> TaskFutureWrappingPythonFuture:
+        """Submits a function to the pool, tracking it as an in-flight task.
+
+        :param fn: Function to run in the pool
+        :param args: Arguments to pass to the function
+        :return: The future associated with the task
+        """
+        if self.pool is None:
+            self.pool = self.create_pool()
         # First submit it
         # Then we need to wrap it in a future
-        future = self.pool.submit(base_execute_task, task)
-        self.active_futures.append(future)
+        future = self.pool.submit(fn, *args)
+        with self._inflight_lock:
+            self._inflight += 1
+        future.add_done_callback(self._task_done)
         return TaskFutureWrappingPythonFuture(future)
 
     def can_submit_task(self) -> bool:
@@ -264,9 +359,7 @@ class PoolExecutor(TaskExecutor, abc.ABC):
 
         :return:
         """
-
-        self._prune_active_futures()
-        return len(self.active_futures) < self.max_tasks
+        return self._inflight < self.max_tasks
 
 
 class MultiThreadingExecutor(PoolExecutor):
@@ -274,7 +367,92 @@ class MultiThreadingExecutor(PoolExecutor):
     in the same process, at submit time."""
 
     def create_pool(self) -> ThreadPoolExecutor:
-        return ThreadPoolExecutor(max_workers=self.max_tasks)
+        return ThreadPoolExecutor(
+            max_workers=self.max_tasks, initializer=self.initializer, initargs=self.initargs
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class _SharedMemoryHandle:
+    """Stands in for a large input placed in shared memory by the MultiProcessingExecutor.
+    This is what actually gets pickled and sent to the worker, rather than the value itself.
+    """
+
+    name: str  # name of the shared memory block
+    size: int  # number of bytes used in the block (it may be rounded up)
+    dtype: Optional[np.dtype] = None  # set if the value is a numpy array, else it is bytes
+    shape: Optional[Tuple[int, ...]] = None
+
+    def resolve(self) -> Any:
+        """Reads the value back out of shared memory. This copies it, so the
+        block can be freed by the submitting process once the task is done.
+
+        :return: The value this handle stands in for
+        """
+        block = shared_memory.SharedMemory(name=self.name)
+        try:
+            if self.dtype is None:
+                return bytes(block.buf[: self.size])
+            return np.ndarray(self.shape, dtype=self.dtype, buffer=block.buf).copy()
+        finally:
+            block.close()
+
+
+@dataclasses.dataclass
+class _SharedInput:
+    """An input the MultiProcessingExecutor has placed in shared memory, shared by all the
+    in-flight tasks that take it. We hold onto the value so its id can't be reused while
+    the block is alive."""
+
+    value: Any
+    block: shared_memory.SharedMemory
+    handle: _SharedMemoryHandle
+    refcount: int = 0
+
+
+# Adapters registered with the MultiProcessingExecutor, populated in each worker when it starts.
+# This way we send a key, rather than pickling the adapter with every task.
+_ADAPTER_CACHE: Dict[str, lifecycle_base.LifecycleAdapterSet] = {}
+
+
+def _init_worker(
+    adapters: Dict[str, lifecycle_base.LifecycleAdapterSet],
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+):
+    """Initializer for MultiProcessingExecutor workers -- stores the registered adapters,
+    then calls the user's initializer, if there is one.
+
+    :param adapters: Adapters to cache, by key
+    :param initializer: User-provided initializer to run in the worker
+    :param initargs: Arguments to pass to the user-provided initializer
+    """
+    _ADAPTER_CACHE.update(adapters)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _execute_task_in_worker(
+    task: TaskImplementation, adapter_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """Executes a task submitted by the MultiProcessingExecutor in the worker. This resolves any
+    inputs placed in shared memory, and looks up the adapter if it was registered.
+
+    :param task: Task to execute, whose dynamic inputs may contain shared memory handles
+    :param adapter_key: Key of the task's adapter in the worker's cache, if it was sent without one
+    :return: The results of the task, as base_execute_task returns them
+    """
+    replacements = {}
+    if adapter_key is not None:
+        replacements["adapter"] = _ADAPTER_CACHE[adapter_key]
+    if any(isinstance(value, _SharedMemoryHandle) for value in task.dynamic_inputs.values()):
+        replacements["dynamic_inputs"] = {
+            key: value.resolve() if isinstance(value, _SharedMemoryHandle) else value
+            for key, value in task.dynamic_inputs.items()
+        }
+    if replacements:
+        task = dataclasses.replace(task, **replacements)
+    return base_execute_task(task)
 
 
 class MultiProcessingExecutor(PoolExecutor):
@@ -283,10 +461,157 @@ class MultiProcessingExecutor(PoolExecutor):
     not yet augmented to handle the right serialization,
     so use at your own risk. We will be fixing shortly,
     but the dask/ray parallelism and the multithreading
-    parallelism executors serialize correctly."""
+    parallelism executors serialize correctly.
+
+    Large numpy arrays/bytes passed in as dynamic inputs can be placed in shared memory
+    (see shared_memory_threshold_bytes), so we only pickle a handle to them, rather than
+    the whole value. Each value (by identity) is only placed once, however many in-flight
+    tasks take it, and is freed when the last of them is done. Adapters can also be
+    registered (see register_adapter), so each worker keeps them, rather than having them
+    pickled with every task."""
+
+    def __init__(
+        self,
+        max_tasks: int,
+        shared_memory_threshold_bytes: Optional[int] = None,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+    ):
+        """Instantiates a multiprocessing executor.
+
+        :param max_tasks: Maximum number of tasks to run at once
+        :param shared_memory_threshold_bytes: Inputs (plain numpy arrays/bytes) at least this
+            large are passed to the workers through shared memory. Defaults to None, meaning we
+            always pickle them. Note that shared memory (/dev/shm) is often small, E.G. 64MB by
+            default in docker, and running out of it crashes the process, so size this with care.
+        :param initializer: Callable run in each worker process as it starts. This must be
+            picklable. State it sets up (E.G. module-level caches) persists between tasks.
+        :param initargs: Arguments to pass to the initializer
+        """
+        super(MultiProcessingExecutor, self).__init__(
+            max_tasks, initializer=initializer, initargs=initargs
+        )
+        self.shared_memory_threshold_bytes = shared_memory_threshold_bytes
+        # id of value -> the value's shared memory, guarded as tasks release it from other threads
+        self._shared_inputs = {}
+        self._shared_inputs_lock = threading.Lock()
+        self._adapters = {}
+
+    def register_adapter(self, key: str, adapter: lifecycle_base.LifecycleAdapterSet):
+        """Registers an adapter to send to each worker once, when the pool is created.
+        Tasks using this adapter (by identity) will then be sent with its key instead of a copy.
+        Note that workers keep their copy between tasks, so any state it holds will persist.
+
+        :param key: Key to reference the adapter by
+        :param adapter: Adapter to register, E.G. ``driver.graph_executor.adapter``
+        """
+        if self.initialized:
+            raise RuntimeError("Cannot register an adapter with an initialized executor")
+        self._adapters[key] = adapter
 
     def create_pool(self) -> ProcessPoolExecutor:
-        return ProcessPoolExecutor(max_workers=self.max_tasks)
+        return ProcessPoolExecutor(
+            max_workers=self.max_tasks,
+            initializer=_init_worker,
+            initargs=(self._adapters, self.initializer, self.initargs),
+        )
+
+    def _to_shared_memory(self, value: Any) -> Optional[_SharedMemoryHandle]:
+        """Places a value in shared memory if it is worth doing so. If it is already there
+        (E.G. the same array passed to every parallel block), we reuse the existing block.
+        Every handle returned must be released with _release_shared_memory.
+
+        :param value: Value to (potentially) place in shared memory
+        :return: The handle to the value, or None if it should just be pickled
+        """
+        # We check the exact type, as we can only rebuild plain arrays/bytes from a buffer.
+        # Subclasses (masked arrays, matrices, memmaps, etc...) would lose their type/data.
+        if type(value) is np.ndarray and not value.dtype.hasobject:
+            size, dtype, shape = value.nbytes, value.dtype, value.shape
+        elif type(value) is bytes:
+            size, dtype, shape = len(value), None, None
+        else:
+            return None
+        if size == 0 or size < self.shared_memory_threshold_bytes:
+            return None
+        with self._shared_inputs_lock:
+            shared_input = self._shared_inputs.get(id(value))
+            if shared_input is None:
+                block = shared_memory.SharedMemory(create=True, size=size)
+                if dtype is None:
+                    block.buf[:size] = value
+                else:
+                    np.ndarray(shape, dtype=dtype, buffer=block.buf)[...] = value
+                handle = _SharedMemoryHandle(name=block.name, size=size, dtype=dtype, shape=shape)
+                shared_input = _SharedInput(value=value, block=block, handle=handle)
+                self._shared_inputs[id(value)] = shared_input
+            shared_input.refcount += 1
+            return shared_input.handle
+
+    def _release_shared_memory(self, value_ids: List[int]):
+        """Releases one reference to each of the values' shared memory, freeing the block
+        once nothing references it.
+
+        :param value_ids: ids of the values whose handles to release
+        """
+        with self._shared_inputs_lock:
+            for value_id in value_ids:
+                shared_input = self._shared_inputs[value_id]
+                shared_input.refcount -= 1
+                if shared_input.refcount == 0:
+                    del self._shared_inputs[value_id]
+                    shared_input.block.close()
+                    shared_input.block.unlink()
+
+    def submit_task(self, task: TaskImplementation) -> TaskFuture:
+        """Submits a task to the process pool, placing large inputs in shared memory
+        (these are released once the task is done), and sending the key of its adapter,
+        rather than the adapter itself, if it is registered.
+
+        :param task: Task to submit
+        :return: The future associated with the task
+        """
+        adapter_key = next(
+            (key for key, adapter in self._adapters.items() if adapter is task.adapter), None
+        )
+        replacements = {}
+        if adapter_key is not None:
+            replacements["adapter"] = None
+        shared_value_ids = []
+        if self.shared_memory_threshold_bytes is not None:
+            dynamic_inputs = {}
+            for key, value in task.dynamic_inputs.items():
+                handle = self._to_shared_memory(value)
+                if handle is not None:
+                    shared_value_ids.append(id(value))
+                dynamic_inputs[key] = value if handle is None else handle
+            if len(shared_value_ids) > 0:
+                replacements["dynamic_inputs"] = dynamic_inputs
+        if not replacements:
+            return super(MultiProcessingExecutor, self).submit_task(task)
+        try:
+            task_future = self._submit(
+                _execute_task_in_worker, dataclasses.replace(task, **replacements), adapter_key
+            )
+        except Exception:
+            self._release_shared_memory(shared_value_ids)
+            raise
+        if len(shared_value_ids) > 0:
+            task_future.add_done_callback(
+                functools.partial(self._release_shared_memory, shared_value_ids)
+            )
+        return task_future
+
+    def finalize(self):
+        """Finalizes pool, freeing up resources (including any leftover shared memory)"""
+        try:
+            super(MultiProcessingExecutor, self).finalize()
+        finally:
+            with self._shared_inputs_lock:
+                for shared_input in self._shared_inputs.values():
+                    shared_input.block.close()
+                    shared_input.block.unlink()
+                self._shared_inputs.clear()
 
 
 class ExecutionManager(abc.ABC):
@@ -327,14 +652,41 @@ class ExecutionManager(abc.ABC):
         pass
 
 
+def _inputs_are_small(inputs: Dict[str, Any], max_input_bytes: int) -> bool:
+    """Cheap check as to whether inputs would be cheap to send to another process.
+    Note that sys.getsizeof is shallow, so containers are judged by their own size only.
+
+    :param inputs: Inputs to check
+    :param max_input_bytes: Max size of any non-primitive input
+    :return: True if every input is a primitive or at most max_input_bytes
+    """
+    return all(
+        value is None
+        or isinstance(value, (bool, int, float, str))
+        or sys.getsizeof(value) <= max_input_bytes
+        for value in inputs.values()
+    )
+
+
 class DefaultExecutionManager(ExecutionManager):
-    def __init__(self, local_executor=None, remote_executor=None):
+    def __init__(
+        self,
+        local_executor=None,
+        remote_executor=None,
+        inline_threshold: Optional[int] = None,
+        inline_max_input_bytes: int = 1024,
+    ):
         """Instantiates a BasicExecutionManager with a local/remote executor.
         These enable us to run certain tasks locally (simple transformations, generating sets of files),
         and certain tasks remotely (processing files in large datasets, etc...)
 
         :param local_executor: Executor to use for running tasks locally
         :param remote_executor:  Executor to use for running tasks remotely
+        :param inline_threshold: If set, blocks with at most this many nodes, whose inputs are all
+            small, are run locally, saving the cost of sending them to the remote executor.
+            Note this gives up parallelism for those blocks. Defaults to None (always remote).
+        :param inline_max_input_bytes: Max size of any (non-primitive) input for a block to be run
+            locally under the inline_threshold.
         """
         if local_executor is None:
             local_executor = SynchronousLocalTaskExecutor()
@@ -343,17 +695,27 @@ class DefaultExecutionManager(ExecutionManager):
         super().__init__([local_executor, remote_executor])
         self.local_executor = local_executor
         self.remote_executor = remote_executor
+        self.inline_threshold = inline_threshold
+        self.inline_max_input_bytes = inline_max_input_bytes
+        # blocks run remotely, everything else runs locally
+        self._executors_by_purpose = {NodeGroupPurpose.EXECUTE_BLOCK: remote_executor}
 
     def get_executor_for_task(self, task: TaskImplementation) -> TaskExecutor:
         """Simple implementation that returns the local executor for single task executions,
+        as well as for small blocks if inline_threshold is set.
 
         :param task: Task to get executor for
         :return: A local task if this is a "single-node" task, a remote task otherwise
         """
-
-        if task.purpose == NodeGroupPurpose.EXECUTE_BLOCK:
-            return self.remote_executor
-        return self.local_executor
+        executor = self._executors_by_purpose.get(task.purpose, self.local_executor)
+        if (
+            executor is self.remote_executor
+            and self.inline_threshold is not None
+            and len(task.nodes) <= self.inline_threshold
+            and _inputs_are_small(task.dynamic_inputs, self.inline_max_input_bytes)
+        ):
+            return self.local_executor
+        return executor
 
 
 def run_graph_to_completion(
@@ -361,44 +723,92 @@ def run_graph_to_completion(
     execution_manager: ExecutionManager,
 ):
     """Blocking call to run the graph until it is complete. Note that this employs a while loop.
-    With the way we handle futures, we should be able to have this event-driven, allowing us
-    to only query when the state is updated, and use that to trigger a new update.
-
-    For now, the while loop is fine.
+    To avoid polling every in-flight task on every iteration, futures that support it push their
+    task ID onto a completion queue when they finish. We only look at the tasks in that queue,
+    and block on it when nothing else has changed. Futures that cannot notify us (E.G. custom
+    TaskFutures) are polled, backing off exponentially (to a small cap) while nothing changes.
 
     :return: Nothing, the execution state/result cache can give us the data
     """
+    # futures that will push their task ID onto the completion queue when done
     task_futures = {}
+    # futures that cannot notify us, so we have to poll them
+    polled_task_futures = {}
+    completions = queue.SimpleQueue()
+    poll_interval = MIN_POLL_INTERVAL_SECONDS
+    # bind these once, as they're called for every task/iteration
+    get_executor_for_task = execution_manager.get_executor_for_task
+    get_graph_state = execution_state.get_graph_state
+    release_next_task = execution_state.release_next_task
+    reject_task = execution_state.reject_task
+    update_task_state = execution_state.update_task_state
+    is_terminal = TaskState.is_terminal
+    is_graph_terminal = GraphState.is_terminal
+    get_completion = completions.get
     execution_manager.init()
     try:
-        while not GraphState.is_terminal(execution_state.get_graph_state()):
-            # get the next task from the queue
-            next_task = execution_state.release_next_task()
-            if next_task is not None:
-                task_executor = execution_manager.get_executor_for_task(next_task)
-                if task_executor.can_submit_task():
-                    try:
-                        submitted = task_executor.submit_task(next_task)
-                    except Exception as e:
-                        logger.exception(
-                            f"Exception submitting task {next_task.task_id}, with nodes: "
-                            f"{[item.name for item in next_task.nodes]}"
-                        )
-                        raise e
+        while not is_graph_terminal(get_graph_state()):
+            progressed = False
+            # release as many tasks as we can before checking on the ones in flight
+            # the loop ends when the queue is empty or an executor is full
+            next_task = release_next_task()
+            while next_task is not None:
+                task_executor = get_executor_for_task(next_task)
+                if not task_executor.can_submit_task():
+                    # Whoops, back on the queue
+                    # We'll wait until something in flight completes before trying again
+                    reject_task(task_to_reject=next_task)
+                    break
+                try:
+                    submitted = task_executor.submit_task(next_task)
+                except Exception as e:
+                    logger.exception(
+                        f"Exception submitting task {next_task.task_id}, with nodes: "
+                        f"{[item.name for item in next_task.nodes]}"
+                    )
+                    raise e
+                if isinstance(submitted, TaskFutureWrappingPythonFuture):
+                    update_task_state(next_task.task_id, TaskState.RUNNING, None)
+                    submitted.add_done_callback(
+                        functools.partial(completions.put, next_task.task_id)
+                    )
                     task_futures[next_task.task_id] = submitted
                 else:
-                    # Whoops, back on the queue
-                    # We should probably wait a bit here, but for now we're going to keep
-                    # burning through
-                    execution_state.reject_task(task_to_reject=next_task)
-            # update all the tasks in flight
-            # copy so we can modify
-            for task_name, task_future in task_futures.copy().items():
+                    polled_task_futures[next_task.task_id] = submitted
+                progressed = True
+                next_task = release_next_task()
+            # update all the tasks we have to poll, keeping the ones still in flight
+            still_polling = {}
+            for task_name, task_future in polled_task_futures.items():
                 state = task_future.get_state()
                 result = task_future.get_result()
-                execution_state.update_task_state(task_name, state, result)
-                if TaskState.is_terminal(state):
-                    del task_futures[task_name]
+                update_task_state(task_name, state, result)
+                if is_terminal(state):
+                    progressed = True
+                else:
+                    still_polling[task_name] = task_future
+            polled_task_futures = still_polling
+            # then update all the tasks that have told us they're done
+            # if nothing has changed, we block until one does (or it's time to poll again)
+            wait_timeout = None
+            if progressed:
+                poll_interval = MIN_POLL_INTERVAL_SECONDS
+            elif len(task_futures) > 0 and len(polled_task_futures) == 0:
+                wait_timeout = WAKE_TIMEOUT_SECONDS
+            else:
+                wait_timeout = poll_interval
+                poll_interval = min(poll_interval * 2, MAX_POLL_INTERVAL_SECONDS)
+            while True:
+                try:
+                    task_name = get_completion(block=wait_timeout is not None, timeout=wait_timeout)
+                except queue.Empty:
+                    break
+                wait_timeout = None  # we only block for the first one
+                poll_interval = MIN_POLL_INTERVAL_SECONDS
+                task_future = task_futures.pop(task_name)
+                update_task_state(task_name, task_future.get_state(), task_future.get_result())
+                # The execution state has stored what it needs from the result
+                task_future._release()
         logger.info(f"Graph is done, graph state is {execution_state.get_graph_state()}")
     finally:
         execution_manager.finalize()
@@ -1,8 +1,9 @@
 import abc
 import dataclasses
 import enum
-from collections import defaultdict
-from typing import Any, Collection, Dict, List, Optional, Set, Tuple
+import functools
+from collections import ChainMap, defaultdict
+from typing import Any, Collection, Dict, List, Mapping, Optional, Set, Tuple
 
 from hamilton import node
 from hamilton.execution import graph_functions
@@ -144,6 +145,13 @@ class TaskImplementation(TaskSpec):
         """Binds dynamic inputs to the task spec, returning a new task spec"""
         return dataclasses.replace(self, dynamic_inputs={**dynamic_inputs, **self.dynamic_inputs})
 
+    @functools.cached_property
+    def merged_overrides(self) -> Mapping[str, Any]:
+        """The dynamic inputs, with the overrides layered on top. These are what we pass
+        as overrides when executing the task. This is a read-through view, so we don't copy
+        either dict. Note that binding creates a new task, so this is never stale."""
+        return ChainMap(self.overrides, self.dynamic_inputs)
+
     @staticmethod
     def determine_task_id(base_id: str, spawning_task: Optional[str], group_id: Optional[str]):
         return ".".join(
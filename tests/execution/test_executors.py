@@ -1,16 +1,22 @@
+import dataclasses
 import os
+import threading
 import time
+from concurrent.futures import Future
 
 import numpy as np
 import pytest
 
 import hamilton.ad_hoc_utils
-from hamilton import base, driver
+from hamilton import base, driver, node
+from hamilton.execution import executors
 from hamilton.execution.executors import (
     DefaultExecutionManager,
     MultiProcessingExecutor,
     MultiThreadingExecutor,
     SynchronousLocalTaskExecutor,
+    TaskFuture,
+    TaskFutureWrappingPythonFuture,
 )
 from hamilton.execution.grouping import (
     GroupByRepeatableBlocks,
@@ -20,6 +26,7 @@ from hamilton.execution.grouping import (
     NodeGroupPurpose,
     TaskImplementation,
 )
+from hamilton.execution.state import TaskState
 from hamilton.htypes import Collect, Parallelizable
 from hamilton.lifecycle import base as lifecycle_base
 
@@ -29,6 +36,7 @@ from tests.resources.dynamic_parallelism import (
     parallel_collect_multiple_arguments,
     parallel_complex,
     parallel_delayed,
+    parallel_large_inputs,
     parallel_linear_basic,
 )
 
@@ -152,6 +160,29 @@ def test_parallelism_would_take_too_long_with_no_parallelism(executor_factory):
     assert time_taken < 10
 
 
+def test_in_flight_futures_are_only_queried_once_done(monkeypatch):
+    queried_while_running = []
+    get_state = TaskFutureWrappingPythonFuture.get_state
+
+    def recording_get_state(self):
+        queried_while_running.append(not self.future.done())
+        return get_state(self)
+
+    monkeypatch.setattr(TaskFutureWrappingPythonFuture, "get_state", recording_get_state)
+    dr = (
+        driver.Builder()
+        .with_modules(parallel_delayed)
+        .enable_dynamic_execution(allow_experimental_mode=True)
+        .with_remote_executor(MultiThreadingExecutor(max_tasks=2))
+        .with_grouping_strategy(GroupByRepeatableBlocks())
+        .build()
+    )
+    result = dr.execute(["final"], inputs={"delay_seconds": 0.1, "number_of_steps": 4})
+    assert result["final"] == sum(i**2 + i**3 for i in range(4))
+    assert len(queried_while_running) == 4
+    assert not any(queried_while_running)
+
+
 @pytest.mark.parametrize(
     "executor_factory",
     [
@@ -201,6 +232,171 @@ def test_end_to_end_with_overrides(executor_factory):
     assert result["final"] == 5
 
 
+@pytest.mark.parametrize("shared_memory_threshold_bytes", [1024**2, None])
+def test_multi_processing_executor_large_inputs(shared_memory_threshold_bytes):
+    executor = MultiProcessingExecutor(
+        max_tasks=2, shared_memory_threshold_bytes=shared_memory_threshold_bytes
+    )
+    dr = (
+        driver.Builder()
+        .with_modules(parallel_large_inputs)
+        .enable_dynamic_execution(allow_experimental_mode=True)
+        .with_remote_executor(executor)
+        .with_grouping_strategy(GroupByRepeatableBlocks())
+        .build()
+    )
+    result = dr.execute(["final"])
+    assert result["final"] == parallel_large_inputs._calc()
+    assert len(executor._shared_inputs) == 0
+
+
+def test_multi_processing_executor_shared_memory_round_trip():
+    executor = MultiProcessingExecutor(max_tasks=1, shared_memory_threshold_bytes=8)
+    array = np.arange(12, dtype=np.int32).reshape(3, 4)[:, ::2]  # non-contiguous view
+    array_handle = executor._to_shared_memory(array)
+    data = b"abcdefghij"
+    bytes_handle = executor._to_shared_memory(data)
+    structured = np.array([(1, 2.0), (3, 4.0)], dtype=[("a", "<i8"), ("b", "<f8")])
+    structured_handle = executor._to_shared_memory(structured)
+    try:
+        assert executor._to_shared_memory(b"abc") is None
+        assert executor._to_shared_memory(np.array(["a", None], dtype=object)) is None
+        # subclasses can't be rebuilt from the buffer, so they get pickled
+        assert (
+            executor._to_shared_memory(np.ma.masked_array(np.arange(4), mask=[0, 1, 0, 1])) is None
+        )
+        np.testing.assert_array_equal(array_handle.resolve(), array)
+        assert bytes_handle.resolve() == data
+        resolved_structured = structured_handle.resolve()
+        assert resolved_structured.dtype == structured.dtype
+        assert resolved_structured.dtype.names == ("a", "b")
+        np.testing.assert_array_equal(resolved_structured, structured)
+    finally:
+        executor._release_shared_memory([id(array), id(data), id(structured)])
+    assert len(executor._shared_inputs) == 0
+
+
+def test_multi_processing_executor_shared_memory_reuses_block_for_same_value():
+    executor = MultiProcessingExecutor(max_tasks=2, shared_memory_threshold_bytes=8)
+    array = np.arange(10)
+    other_array = np.arange(10)
+    first_handle = executor._to_shared_memory(array)
+    second_handle = executor._to_shared_memory(array)
+    other_handle = executor._to_shared_memory(other_array)
+    assert first_handle == second_handle
+    assert other_handle.name != first_handle.name
+    executor._release_shared_memory([id(array)])
+    # still referenced by the second "task"
+    np.testing.assert_array_equal(second_handle.resolve(), array)
+    executor._release_shared_memory([id(array)])
+    assert list(executor._shared_inputs) == [id(other_array)]
+    # finalize frees anything left over
+    executor.init()
+    executor.finalize()
+    assert len(executor._shared_inputs) == 0
+
+
+def test_multi_processing_executor_registered_adapter():
+    executor = MultiProcessingExecutor(max_tasks=2)
+    dr = (
+        driver.Builder()
+        .with_modules(parallel_linear_basic)
+        .enable_dynamic_execution(allow_experimental_mode=True)
+        .with_remote_executor(executor)
+        .with_grouping_strategy(GroupByRepeatableBlocks())
+        .build()
+    )
+    executor.register_adapter("driver", dr.graph_executor.adapter)
+    result = dr.execute(["final"])
+    assert result["final"] == parallel_linear_basic._calc()
+
+
+def test_pool_executor_creates_pool_on_first_submit():
+    executor = MultiThreadingExecutor(max_tasks=1)
+    executor.init()
+    try:
+        assert executor.pool is None
+        executor.submit_task(create_dummy_task(NodeGroupPurpose.EXECUTE_BLOCK)).future.result()
+        assert executor.pool is not None
+    finally:
+        executor.finalize()
+    assert executor.pool is None
+
+
+def test_pool_executor_finalize_without_submitting():
+    executor = MultiProcessingExecutor(max_tasks=1)
+    executor.init()
+    executor.finalize()
+    assert executor.pool is None
+    with pytest.raises(RuntimeError):
+        executor.finalize()
+
+
+def test_multi_processing_executor_cannot_register_adapter_once_initialized():
+    executor = MultiProcessingExecutor(max_tasks=1)
+    executor.init()
+    try:
+        with pytest.raises(RuntimeError):
+            executor.register_adapter("foo", lifecycle_base.LifecycleAdapterSet())
+    finally:
+        executor.finalize()
+
+
+def test_execute_task_in_worker_uses_cached_adapter(monkeypatch):
+    adapter = lifecycle_base.LifecycleAdapterSet()
+    monkeypatch.setattr(executors, "_ADAPTER_CACHE", {})
+    executors._init_worker({"foo": adapter})
+    task = dataclasses.replace(create_dummy_task(NodeGroupPurpose.EXECUTE_BLOCK), adapter=None)
+    assert executors._execute_task_in_worker(task, "foo") == {}
+
+
+def _touch_worker_file(directory: str):
+    with open(os.path.join(directory, str(os.getpid())), "w"):
+        pass
+
+
+def test_multi_processing_executor_initializer(tmp_path):
+    dr = (
+        driver.Builder()
+        .with_modules(parallel_linear_basic)
+        .enable_dynamic_execution(allow_experimental_mode=True)
+        .with_remote_executor(
+            MultiProcessingExecutor(
+                max_tasks=2, initializer=_touch_worker_file, initargs=(str(tmp_path),)
+            )
+        )
+        .with_grouping_strategy(GroupByRepeatableBlocks())
+        .build()
+    )
+    assert dr.execute(["final"])["final"] == parallel_linear_basic._calc()
+    worker_pids = os.listdir(tmp_path)
+    assert 0 < len(worker_pids) <= 2
+    assert str(os.getpid()) not in worker_pids
+
+
+def test_multi_threading_executor_initializer():
+    worker_state = threading.local()
+    initialized_threads = set()
+
+    def initializer(value: int):
+        worker_state.value = value
+        initialized_threads.add(threading.get_ident())
+
+    dr = (
+        driver.Builder()
+        .with_modules(parallel_linear_basic)
+        .enable_dynamic_execution(allow_experimental_mode=True)
+        .with_remote_executor(
+            MultiThreadingExecutor(max_tasks=2, initializer=initializer, initargs=(1,))
+        )
+        .with_grouping_strategy(GroupByRepeatableBlocks())
+        .build()
+    )
+    assert dr.execute(["final"])["final"] == parallel_linear_basic._calc()
+    assert 0 < len(initialized_threads) <= 2
+    assert not hasattr(worker_state, "value")  # only set for the worker threads
+
+
 def create_dummy_task(task_purpose: NodeGroupPurpose):
     return TaskImplementation(
         base_id="foo",
@@ -236,6 +432,72 @@ def test_get_execotor_for_tasks_default_execution_manager(purpose, check):
     assert check(execution_manager.get_executor_for_task(create_dummy_task(purpose)))
 
 
+def test_task_futures_do_not_carry_dict():
+    assert not hasattr(TaskFuture(get_state=lambda: None, get_result=lambda: None), "__dict__")
+    assert not hasattr(TaskFutureWrappingPythonFuture(Future()), "__dict__")
+
+
+def test_task_future_wrapping_python_future_notifies_on_completion():
+    future = Future()
+    task_future = TaskFutureWrappingPythonFuture(future)
+    done = threading.Event()
+    task_future.add_done_callback(done.set)
+    assert not done.is_set()
+    future.set_result({"foo": 1})
+    assert done.is_set()
+    assert task_future.get_result() == {"foo": 1}
+
+
+def test_task_future_wrapping_python_future_caches_failure():
+    future = Future()
+    task_future = TaskFutureWrappingPythonFuture(future)
+    assert task_future.get_state() == TaskState.RUNNING
+    assert task_future.get_result() is None
+    future.set_exception(ValueError("foo"))
+    assert task_future.get_state() == TaskState.FAILED
+    assert task_future.get_state() == TaskState.FAILED
+    with pytest.raises(ValueError):
+        task_future.get_result()
+
+
+@pytest.mark.parametrize(
+    "num_nodes, dynamic_inputs, expected_local",
+    [
+        (1, {"foo": 1, "bar": "baz"}, True),
+        (1, {"foo": np.ones(10_000)}, False),
+        (3, {"foo": 1}, False),
+    ],
+)
+def test_default_execution_manager_inlines_small_blocks(num_nodes, dynamic_inputs, expected_local):
+    local_executor = SynchronousLocalTaskExecutor()
+    execution_manager = DefaultExecutionManager(
+        local_executor=local_executor,
+        remote_executor=MultiProcessingExecutor(max_tasks=10),
+        inline_threshold=2,
+    )
+    task = dataclasses.replace(
+        create_dummy_task(NodeGroupPurpose.EXECUTE_BLOCK),
+        nodes=[
+            node.Node(name=f"node_{i}", typ=int, node_source=node.NodeType.EXTERNAL)
+            for i in range(num_nodes)
+        ],
+        dynamic_inputs=dynamic_inputs,
+    )
+    is_local = execution_manager.get_executor_for_task(task) is local_executor
+    assert is_local == expected_local
+
+
+def test_task_future_wrapping_python_future_release():
+    future = Future()
+    future.set_result({"foo": 1})
+    task_future = TaskFutureWrappingPythonFuture(future)
+    assert task_future.get_result() == {"foo": 1}
+    task_future._release()
+    assert task_future.future is None
+    assert task_future.get_state() == TaskState.SUCCESSFUL
+    assert task_future.get_result() is None
+
+
 def test_end_to_end_parallelizable_with_input_in_collect():
     dr = (
         driver.Builder()
@@ -347,3 +609,21 @@ def test_parallel_end_to_end_with_empty_list():
     parallel_collect_multiple_arguments._reset_counter()
     res = dr.execute(["final"], overrides={"number_of_steps": 0})
     assert res["final"] == parallel_linear_basic._calc(0)
+
+
+def test_multi_threading_executor_frees_capacity_on_completion(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(executors, "base_execute_task", lambda task: release.wait())
+    executor = MultiThreadingExecutor(max_tasks=1)
+    executor.init()
+    try:
+        task_future = executor.submit_task(create_dummy_task(NodeGroupPurpose.EXECUTE_BLOCK))
+        assert not executor.can_submit_task()
+        # callbacks run in order, so this fires after the executor has freed the slot
+        done = threading.Event()
+        task_future.add_done_callback(done.set)
+        release.set()
+        done.wait()
+        assert executor.can_submit_task()
+    finally:
+        executor.finalize()
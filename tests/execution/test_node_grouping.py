@@ -147,3 +147,22 @@ def test_task_get_input_vars_user_defined():
         spawning_task_base_id=None,
     )
     assert task.get_input_vars() == (["foo"], [])
+
+
+def test_task_implementation_merged_overrides():
+    task = grouping.TaskImplementation(
+        base_id="foo",
+        spawning_task_base_id=None,
+        nodes=[],
+        purpose=NodeGroupPurpose.EXECUTE_BLOCK,
+        outputs_to_compute=[],
+        overrides={"bar": 1},
+        adapter=lifecycle_base.LifecycleAdapterSet(),
+        base_dependencies=[],
+        group_id=None,
+        realized_dependencies={},
+        spawning_task_id=None,
+        dynamic_inputs={"bar": 0, "baz": 2},
+    )
+    assert task.merged_overrides == {"bar": 1, "baz": 2}
+    assert task.bind({"qux": 3}).merged_overrides == {"bar": 1, "baz": 2, "qux": 3}
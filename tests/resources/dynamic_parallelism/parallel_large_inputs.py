@@ -0,0 +1,38 @@
+import numpy as np
+
+from hamilton.htypes import Collect, Parallelizable
+
+
+# input
+def number_of_steps() -> int:
+    return 4
+
+
+def large_array() -> np.ndarray:
+    return np.arange(1_000_000, dtype=np.float64)
+
+
+def large_bytes() -> bytes:
+    return b"a" * 2_000_000
+
+
+# expand
+def steps(number_of_steps: int) -> Parallelizable[int]:
+    yield from range(number_of_steps)
+
+
+# process -- the large inputs are external to the block, so they get passed in to each task
+def step_total(steps: int, large_array: np.ndarray, large_bytes: bytes) -> float:
+    return float(large_array[steps] + large_array.sum() + len(large_bytes))
+
+
+# join
+def final(step_total: Collect[float]) -> float:
+    return sum(step_total)
+
+
+def _calc(number_of_steps: int = number_of_steps()) -> float:
+    array = large_array()
+    return sum(
+        float(array[step] + array.sum() + len(large_bytes())) for step in range(number_of_steps)
+    )